@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import itertools
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import Any, Callable, Collection, List, Optional, Union, get_args
+from dataclasses import dataclass, field
+from typing import Any, Callable, Collection, List, Optional, Tuple, Union, get_args
 
 from cadcad.points import Point
 from cadcad.spaces import Space
@@ -17,66 +15,132 @@ def block(
         Union[Point[Space], Collection[Point[Space]]],
     ],
     param_space: Optional[Space] = None,
+    *,
+    domain: Optional[Collection[Point[Space]]] = None,
+    codomain: Optional[Union[Point[Space], Collection[Point[Space]]]] = None,
 ) -> Block:
-    """_summary_
+    """
+    Build a Block from a type annotated function.
 
     Parameters
     ----------
     func : Callable
-        _description_
+        Block function. Its annotations define the domain and the codomain of the block, unless
+        both are given explicitly.
+    param_space : Optional[Space], optional
+        Parameter space of the block.
+    domain : Optional[Collection[Point[Space]]], optional
+        Points that the block receives, in argument order. Skips the annotation parsing when
+        given together with `codomain`.
+    codomain : Optional[Union[Point[Space], Collection[Point[Space]]]], optional
+        Point(s) that the block returns. Skips the annotation parsing when given together with
+        `domain`.
 
     Returns
     -------
-    Callable
-        _description_
+    Block
+        A new block wrapping `func`.
+    """
+    # Explicit domains and codomains are checked as annotations would be, even when only one of
+    # them is given and the other is parsed from the function.
+    if domain is not None and not all(_is_point_annotation(dom) for dom in domain):
+        raise TypeError(
+            "The domain of a block function must be a point of a space or a collection of them."
+        )
+
+    if codomain is not None and not _is_point_annotation(codomain):
+        raise TypeError(
+            "The return of a block function must be a point of a space or a collection of them."
+        )
+
+    if domain is None or codomain is None:
+        parsed_domain, parsed_codomain = _parse_signature(func)
+        domain = parsed_domain if domain is None else domain
+        codomain = parsed_codomain if codomain is None else codomain
+
+    # The domain is stored as a tuple, so the frozen block and its cached names cannot drift.
+    return Block(func, tuple(domain), codomain, param_space)
+
+
+def _parse_signature(
+    func: Callable,
+) -> Tuple[List[Point], Union[Point[Space], Collection[Point[Space]]]]:
     """
-    func_annotations = deepcopy(func.__annotations__)
+    Extract the domain and codomain of a block function from its type annotations.
+
+    Parameters
+    ----------
+    func : Callable
+        Type annotated block function.
+
+    Returns
+    -------
+    Tuple[List[Point], Union[Point[Space], Collection[Point[Space]]]]
+        The domain and the codomain of the block function.
+    """
+    func_annotations = func.__annotations__
 
     if not func_annotations:
         raise ValueError("The block function must be type annotated")
 
     return_type = func_annotations["return"]
-    specialized_type = get_args(return_type)[0]
-
-    if issubclass(return_type.__origin__, Point) and isinstance(specialized_type, Space):
-        codomain: Union[Point[Space], Collection[Point[Space]]] = return_type
-    elif (
-        isinstance(return_type, Collection)
-        and isinstance(specialized_type, Point)
-        and isinstance(get_args(specialized_type)[0], Space)
-    ):
-        codomain = return_type
-    else:
+
+    if not _is_point_annotation(return_type):
         raise TypeError(
             "The return of a block function must be a point of a space or a collection of them."
         )
 
-    del func_annotations["return"]
-
-    domain_types = list(func_annotations.values())
-    specialized_domain = [get_args(dom) for dom in domain_types]
-    specialized_domain_types = list(itertools.chain(*specialized_domain))
-
+    codomain: Union[Point[Space], Collection[Point[Space]]] = return_type
     domain: List[Point] = []
 
-    for domain_tuple in zip(domain_types, specialized_domain_types):
-        if issubclass(domain_tuple[0].__origin__, Point) and isinstance(domain_tuple[1], Space):
-            domain.append(domain_tuple[0])
-        elif (
-            isinstance(domain_tuple[0], Collection)
-            and isinstance(domain_tuple[1], Point)
-            and isinstance(get_args(domain_tuple[1])[0], Space)
-        ):
-            domain.append(domain_tuple[0])  # type: ignore
-        else:
+    for name, domain_type in func_annotations.items():
+        if name == "return":
+            continue
+
+        if not _is_point_annotation(domain_type):
             raise TypeError(
                 "The domain of a block function must be a point of a space or a collection of them."
             )
 
-    return Block(func, domain, codomain, param_space)
+        domain.append(domain_type)
+
+    return domain, codomain
+
+
+def _is_point_annotation(annotation: Any) -> bool:
+    """
+    Check if an annotation is a point of a space or a collection of them.
+
+    The result is not memoized, as a cache keyed on the annotation would keep its Spaces alive.
+
+    Parameters
+    ----------
+    annotation : Any
+        Annotation of a block function argument or return.
+
+    Returns
+    -------
+    bool
+        True if the annotation can be used as a block domain or codomain, False otherwise.
+    """
+    args = get_args(annotation)
+
+    if not args:
+        return False
+
+    origin = getattr(annotation, "__origin__", None)
 
+    if isinstance(origin, type) and issubclass(origin, Point) and isinstance(args[0], Space):
+        return True
 
-@dataclass
+    return (
+        isinstance(annotation, Collection)
+        and isinstance(args[0], Point)
+        and isinstance(get_args(args[0])[0], Space)
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class Block:
     """Blocks in cadCAD.
 
@@ -84,102 +148,97 @@ class Block:
     ----------
     function: Callable
         function to be executed by the block
-    domains: Space | Collection[Space]
-        space(s) that incoming point(s) must adhere to
-    codomains: Space | Collection[Space]
-        space(s) that outgoing point(s) must adhere to
+    domain: Point | Collection[Point]
+        point(s) that incoming point(s) must adhere to
+    codomain: Point | Collection[Point]
+        point(s) that outgoing point(s) must adhere to
     param_space: Space
         parameter space of the block (optional)
     """
 
-    __function: Callable[
+    function: Callable[
         [Union[Point, Collection[Point]]],
         Union[Point, Collection[Point]],
     ]
-    __domain: Union[Point, Collection[Point]]
-    __codomain: Union[Point, Collection[Point]]
-    __param_space: Optional[Space] = None
-
-    @property
-    def function(
-        self,
-    ) -> Callable[[Union[Point, Collection[Point]]], Union[Point, Collection[Point]]]:
-        """Get the function of the block."""
-        return self.__function
-
-    @property
-    def domain(self) -> Union[Point, Collection[Point]]:
-        """Get the domains of the block."""
-        return self.__domain
-
-    @property
-    def codomain(self) -> Union[Point, Collection[Point]]:
-        """Get the codomains of the block."""
-        return self.__codomain
+    domain: Union[Point, Collection[Point]]
+    codomain: Union[Point, Collection[Point]]
+    param_space: Optional[Space] = None
+    __domain_names: Union[str, List[str]] = field(init=False, repr=False, compare=False)
+    __codomain_names: Union[str, List[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Blocks built directly with a list domain get a tuple too, so no block shares a
+        # mutable domain with its copies.
+        if isinstance(self.domain, list):
+            object.__setattr__(self, "domain", tuple(self.domain))
+
+        # Slotted instances have no __dict__ for cached_property, so the names are resolved
+        # once at construction. Blocks are frozen, so the domain and codomain cannot change
+        # afterwards and leave the names stale.
+        object.__setattr__(self, "_Block__domain_names", self._get_space_names(self.domain))
+        object.__setattr__(self, "_Block__codomain_names", self._get_space_names(self.codomain))
 
     @property
     def codomain_names(self) -> Union[str, List[str]]:
-        return self._get_space_names(self.codomain)
+        """Get the names of the codomain spaces."""
+        return self.__codomain_names
 
     @property
     def domain_names(self) -> Union[str, List[str]]:
-        return self._get_space_names(self.domain)
+        """Get the names of the domain spaces."""
+        return self.__domain_names
 
     @staticmethod
     def _get_space_names(points: Union[Point, Collection[Point]]) -> Union[str, List[str]]:
+        # `Space.name()` only returns `__name__`; reading it directly skips a classmethod call.
         if isinstance(points, (list, tuple)):
             names = []
             for pt in points:
                 (space,) = pt.__args__  # Point should only have 1 arg
-                names.append(space.name())
+                names.append(space.__name__)
             return names
         (space,) = points.__args__  # points is a single Point; Point should only have 1 arg
-        return space.name()
-
-    @property
-    def param_space(self) -> Optional[Space]:
-        """Get the parameter space of the block."""
-        return self.__param_space
+        return space.__name__
 
     def name(self) -> str:
         """Get the name of the block."""
-        return self.__function.__name__
+        return self.function.__name__
 
-    def __copy(self) -> Block:
-        """Make a deep copy of a block object.
+    def __copy__(self) -> Block:
+        """Make a shallow copy of a block object.
 
-        The resulting block will be mutable. Inherits all other atributes from the parent block.
+        Inherits all atributes from the parent block. The function, domain, codomain and
+        parameter space are shared with the parent block, as they are not meant to be mutated.
 
         Returns:
             Block: new block
         """
         cls = self.__class__
         new_blk = cls.__new__(cls)
-        internal_dict = deepcopy(self.__dict__)
-        internal_dict["_Block__frozen"] = False
-        new_blk.__dict__.update(internal_dict)
+        for attr in cls.__slots__:
+            object.__setattr__(new_blk, attr, getattr(self, attr))
         return new_blk
 
-    def __copy__(self) -> Block:
-        """Forbidden copy method."""
-        return self.__copy()
-
     def __deepcopy__(self, memo: dict) -> Block:
-        """Forbidden copy method."""
-        return self.__copy()
+        """Make a copy of a block object sharing the same state as `__copy__`.
 
-    def __str__(self) -> str:
-        """Return a string representation of a space."""
-        newline = "\n"
+        A block only references its function, a tuple of typing objects and spaces, none of
+        which can be changed through the block, so a deep copy is the same as a shallow one.
+        """
+        return self.__copy__()
 
-        str_result = f"Block {self.function.__name__} "
-        str_result += f"has domains: {newline}-> {self.domain},{newline}"
-        str_result += f"has codomains: {newline}-> {self.codomains},{newline}"
+    def __str__(self) -> str:
+        """Return a string representation of a block."""
+        parts = [
+            f"Block {self.function.__name__} ",
+            f"has domains: \n-> {self.domain},\n",
+            f"has codomains: \n-> {self.codomain},\n",
+        ]
 
         if self.param_space:
-            str_result += f"has parameter space {self.param_space} "
+            parts.append(f"has parameter space {self.param_space} ")
 
-        return str_result
+        return "".join(parts)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        return self.__function(*args, **kwargs)
+        return self.function(*args, **kwargs)
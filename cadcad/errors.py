@@ -59,10 +59,10 @@ class WiringError(Exception):
     domain of the subsequent block."""
 
     def __init__(self, curr_block, next_block) -> None:
-        curr_block_name = curr_block._Block__function.__name__
-        next_block_name = next_block._Block__function.__name__
+        curr_block_name = curr_block.name()
+        next_block_name = next_block.name()
         curr_block_codomains = curr_block.codomain_names
-        next_block_domains = curr_block.domain_names
+        next_block_domains = next_block.domain_names
         self.message = f"Block ({curr_block_name}) codomain ({curr_block_codomains}) does not \
             *exactly match* subsequent block ({next_block_name}) domain ({next_block_domains})."
 
@@ -73,7 +73,7 @@ class BlockInputError(Exception):
     """Exception raised when the block input Point is not found in the block's domain."""
 
     def __init__(self, current_state, block) -> None:
-        block_name = block._Block__function.__name__
+        block_name = block.name()
         self.message = f"Block {block_name} requires Point[{block.domain_names}] as input; you \
             passed Point[{current_state.space.name()}]"
 
@@ -84,7 +84,7 @@ class BlockOutputError(Exception):
     """Exception raised when the block output Point is not found in the block's codomain."""
 
     def __init__(self, block, next_state) -> None:
-        block_name = block._Block__function.__name__
+        block_name = block.name()
         self.message = f"Block {block_name} must return Point[{block.codomain_names}]; returned \
             Point[{next_state.space.name()}] instead"
 
@@ -2,12 +2,28 @@
 
 import json
 from inspect import getmro
-from typing import Any, Collection, Dict, Generic, TypeVar, get_args
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Generic,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    get_args,
+)
+from weakref import WeakKeyDictionary
 
 from cadcad.spaces import Space
 
 TSpace_co = TypeVar("TSpace_co", bound=Space, covariant=True)
 
+# Compiled schema validators of each Space type, built on the first Point of that Space.
+_VALIDATORS: "WeakKeyDictionary[type, Callable[[Mapping[str, Any]], bool]]" = WeakKeyDictionary()
+
 
 class Point(Generic[TSpace_co]):
     """
@@ -17,16 +33,23 @@ class Point(Generic[TSpace_co]):
     ----------
     space: Space
         space which the point must conform to
-    data: Dict[str, Any]
-        dictionary of dimension names to data that obeys the dimension type
+    data: Mapping[str, Any]
+        read-only mapping of dimension names to data that obeys the dimension type. Only the
+        top level is read-only: nested data, such as the dict of a nested Space dimension, is
+        stored as given and can still be changed.
+
+    Points are hashable only when all of their data values are, so points holding nested
+    dicts raise a TypeError on `hash()`.
     """
 
-    def __init__(self, space: TSpace_co, data: Dict[str, Any], check_types: bool = True):
+    __slots__ = ("__space", "__data", "__hash")
+
+    def __init__(self, space: TSpace_co, data: Mapping[str, Any], check_types: bool = True):
         """Build a space based on a tuple of dimensions.
 
         Args:
             space (Space): space which the point must conform to
-            data: (Dict[str, Any]): dict of dimension names to data that obeys the dimension type
+            data: (Mapping[str, Any]): dimension names to data that obeys the dimension type
         Raises:
             SchemaError: if there is a mismatch between the data and space's schema
         """
@@ -35,22 +58,22 @@ class Point(Generic[TSpace_co]):
         else:
             raise TypeError("Points must be specialized by Spaces")
 
-        dims = space.dimensions(as_types=True)  # type: ignore
+        # Plain dicts skip the slower abstract Mapping check.
+        if not isinstance(data, (dict, Mapping)):
+            raise TypeError("Point's data must be a mapping")
 
-        if not isinstance(data, Dict):
-            raise TypeError("Point's data must be a dictionary")
+        if check_types and not _schema_validator(space)(data):
+            dims = space.dimensions(as_types=True)  # type: ignore
+            received_type = [f"{name} -> {type(value)}" for name, value in data.items()]
+            raise ValueError(
+                "Schema mismatch between the Point's Space and the data given. "
+                + f"Expected {dims}, but received {received_type}"
+            )
 
-        if check_types:
-            if check_schema(dims, data):
-                self.__data: Dict[str, Any] = data
-            else:
-                received_type = [f"{name} -> {type(value)}" for name, value in data.items()]
-                raise ValueError(
-                    "Schema mismatch between the Point's Space and the data given. "
-                    + f"Expected {dims}, but received {received_type}"
-                )
-        else:
-            self.__data = data
+        # The top level of the data is copied and read-only, so the keys and values of a Point
+        # cannot be swapped after it is validated.
+        self.__data: Mapping[str, Any] = MappingProxyType(dict(data))
+        self.__hash: Optional[int] = None
 
     @property
     def space(self) -> Space:
@@ -58,19 +81,41 @@ class Point(Generic[TSpace_co]):
         return self.__space
 
     @property
-    def data(self) -> Dict[str, Any]:
-        """Get the data of the Point."""
+    def data(self) -> Mapping[str, Any]:
+        """Get the read-only data of the Point. Nested values are not copied nor frozen."""
         return self.__data
 
     def __getitem__(self, key: str) -> Any:
         """Get data inside of the point through indexing."""
         return self.__data[key]
 
+    def __reduce__(self) -> Tuple[type, Tuple[Space, Dict[str, Any], bool]]:
+        """Rebuild the point from its space and a plain dict of its data on copy and pickle."""
+        return (Point, (self.__space, dict(self.__data), False))
+
+    def __eq__(self, other: object) -> bool:
+        """Check if two points belong to the same space and hold the same data."""
+        if not isinstance(other, Point):
+            return NotImplemented
+        return self.__space is other.space and self.__data == other.data
+
+    def __hash__(self) -> int:
+        """Hash the point by its space and data, computed on first use.
+
+        Raises a TypeError if any of the data values is not hashable.
+        """
+        if self.__hash is None:
+            self.__hash = hash((self.__space, frozenset(self.__data.items())))
+        return self.__hash
+
+    def __repr__(self) -> str:
+        """Return a short representation of a point, without serializing its data."""
+        return f"Point[{self.__space.__name__}](keys={list(self.__data)})"
+
     def __str__(self) -> str:
         """Return a string representation of a point."""
-        newl = "\n"
-        data = json.dumps(dict(self.data), indent=4, default=str)
-        return f"Point in space {self.space.name()} has data{newl}{data}{newl}"  # type: ignore
+        data = json.dumps(dict(self.__data), indent=4, default=str)
+        return f"Point in space {self.__space.__name__} has data\n{data}\n"
 
 
 def check_schema(dim_dict: Dict[str, type], data_dict: Dict[str, Any]) -> bool:
@@ -88,32 +133,92 @@ def check_schema(dim_dict: Dict[str, type], data_dict: Dict[str, Any]) -> bool:
     bool
         _description_
     """
-    confirmations = 0
-
-    for (dim_name, dim_type), (data_name, data_value) in zip(
-        sorted(dim_dict.items()), sorted(data_dict.items()), strict=True
-    ):
-        if isinstance(dim_type, type):
-            specialized_type = get_args(dim_type)
-            dim_mro = getmro(dim_type)
-        else:
-            raise TypeError("The dimension must be a type.")
-
-        if isinstance(dim_type, Space) and dim_name == data_name:
-            inner_dims = dim_type.dimensions(as_types=True)  # type: ignore
-            if check_schema(inner_dims, data_value):
-                confirmations += 1
-        elif dim_name == data_name and specialized_type and issubclass(dim_mro[0], Collection):
-            if isinstance(specialized_type[0], Space):
-                inner_dims = specialized_type[0].dimensions(as_types=True)  # type: ignore
-                if check_schema(inner_dims, data_value[0]):
-                    confirmations += 1
-            elif isinstance(data_value[0], specialized_type[0]):
-                confirmations += 1
-        elif dim_name == data_name and not specialized_type and isinstance(data_value, dim_type):
-            confirmations += 1
-
-    if confirmations == len(data_dict):
-        return True
-
-    return False
+    return _compile_schema(dim_dict)(data_dict)
+
+
+def _schema_validator(space: Space) -> Callable[[Mapping[str, Any]], bool]:
+    """
+    Get the validator of a Space schema, compiling it on first use.
+
+    Parameters
+    ----------
+    space : Space
+        Space which the data must conform to.
+
+    Returns
+    -------
+    Callable[[Mapping[str, Any]], bool]
+        Function returning True if the data obeys the Space schema, False otherwise.
+    """
+    validator = _VALIDATORS.get(space)
+
+    if validator is None:
+        validator = _compile_schema(space.dimensions(as_types=True))  # type: ignore
+        _VALIDATORS[space] = validator
+
+    return validator
+
+
+def _compile_schema(dim_dict: Dict[str, type]) -> Callable[[Mapping[str, Any]], bool]:
+    """
+    Build the validator of a schema.
+
+    The dimensions, nested Spaces and collection types are resolved once, when the validator is
+    built, instead of on every validated data.
+
+    Parameters
+    ----------
+    dim_dict : Dict[str, type]
+        Dimension names and types which the data must conform to.
+
+    Returns
+    -------
+    Callable[[Mapping[str, Any]], bool]
+        Function returning True if the data obeys the schema, False otherwise.
+    """
+    checks = tuple((dim_name, _compile_check(dim_type)) for dim_name, dim_type in dim_dict.items())
+    dim_names = frozenset(dim_dict)
+
+    def validator(data: Mapping[str, Any]) -> bool:
+        if not isinstance(data, (dict, Mapping)) or data.keys() != dim_names:
+            return False
+        return all(check(data[dim_name]) for dim_name, check in checks)
+
+    return validator
+
+
+def _compile_check(dim_type: type) -> Callable[[Any], bool]:
+    """
+    Build the check of a single dimension value.
+
+    Parameters
+    ----------
+    dim_type : type
+        Type of the dimension.
+
+    Returns
+    -------
+    Callable[[Any], bool]
+        Function returning True if the value obeys the dimension type, False otherwise.
+    """
+    if not isinstance(dim_type, type):
+        raise TypeError("The dimension must be a type.")
+
+    if isinstance(dim_type, Space):
+        return _schema_validator(dim_type)
+
+    specialized_type = get_args(dim_type)
+
+    if not specialized_type:
+        return lambda value: isinstance(value, dim_type)
+
+    if issubclass(getmro(dim_type)[0], Collection):
+        inner_type = specialized_type[0]
+
+        if isinstance(inner_type, Space):
+            inner_validator = _schema_validator(inner_type)
+            return lambda value: inner_validator(value[0])
+
+        return lambda value: isinstance(value[0], inner_type)
+
+    return lambda value: False
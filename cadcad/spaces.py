@@ -3,13 +3,20 @@ Definition of Spaces
 """
 
 import logging
-from copy import deepcopy
-from typing import Any, Collection, Dict, Generator, Union, get_type_hints
+from sys import intern
+from typing import Any, Collection, Dict, Tuple, Union, get_type_hints
+from weakref import WeakKeyDictionary
 
 from cadcad.errors import IllFormedError, InstanceError
 
 log = logging.getLogger(__name__)
 
+# Resolved type hints of each Space type, which are immutable once the type is built.
+_HINTS_CACHE: "WeakKeyDictionary[type, Tuple[Tuple[str, type], ...]]" = WeakKeyDictionary()
+
+# Hashed dimension types of each Space type, used to compare spaces for equivalence.
+_DIM_TYPES_CACHE: "WeakKeyDictionary[type, Tuple[int, Tuple[type, ...]]]" = WeakKeyDictionary()
+
 
 class Space(type):
     """
@@ -18,23 +25,17 @@ class Space(type):
     as an input.
     """
 
-    def __str__(cls: type) -> str:
-        """
-        A space has both a name and an identifier. This methods prints the name.
-        """
-        if not cls.dimensions():  # type: ignore
-            return f"Empty space {cls.__name__}"
-        else:
-            return f"Space {cls.__name__} has dimensions {cls.dimensions()}"  # type: ignore
-
     def __repr__(cls) -> str:
         """
         A space has both a name and an identifier. This methods prints the name.
         """
-        if not cls.dimensions():  # type: ignore
+        dims = cls.dimensions()  # type: ignore
+        if not dims:
             return f"Empty space {cls.__name__}"
         else:
-            return f"Space {cls.__name__} has dimensions {cls.dimensions()}"  # type: ignore
+            return f"Space {cls.__name__} has dimensions {dims}"
+
+    __str__ = __repr__
 
     def __mul__(cls: type, other: type) -> type:
         return cls.cartesian(other)  # type: ignore
@@ -69,34 +70,20 @@ def space(cls: type) -> type:
     if not hasattr(cls, "__annotations__"):
         setattr(cls, "__annotations__", {})
 
-    for value in cls.__annotations__.values():
-        if not isinstance(value, type):
-            raise IllFormedError
+    if not all(isinstance(value, type) for value in cls.__annotations__.values()):
+        raise IllFormedError
 
-    # Instance methods for the Space type.
-    cls.dimensions = classmethod(__dimensions)  # type: ignore
-    cls.cartesian = classmethod(__cartesian)  # type: ignore
-    cls.pow = classmethod(__power)  # type: ignore
-    cls.name = classmethod(__name)  # type: ignore
-    cls.copy = classmethod(__copy)  # type: ignore
-    cls.rename_dims = classmethod(__rename_dims)  # type: ignore
-    cls.is_empty = classmethod(__is_empty)  # type: ignore
-    cls.unroll_schema = classmethod(__unroll_schema)  # type: ignore
-    cls.add = classmethod(__add)  # type: ignore
-    cls.nest = classmethod(__nest)  # type: ignore
-    cls.is_equivalent = classmethod(__is_equivalent)  # type: ignore
-
-    setattr(cls, __init__.__name__, __init__)
-
-    class NewSpace(cls, metaclass=Space):
-        """
-        Fake class to enable overloading operators on types
-        """
+    # The Space type is rebuilt from the class namespace with the Space metaclass, which enables
+    # overloading operators on types. The instance dict and weakref descriptors belong to `cls`,
+    # so the new type creates its own.
+    namespace = dict(cls.__dict__)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
 
-    NewSpace.__name__ = cls.__name__
-    setattr(NewSpace, "__annotations__", cls.__annotations__)
+    # Instance methods for the Space type.
+    namespace.update(_SPACE_METHODS)
 
-    return NewSpace
+    return Space(cls.__name__, cls.__bases__, namespace)
 
 
 def multiply(operands: Collection[type]) -> type:
@@ -115,11 +102,9 @@ def multiply(operands: Collection[type]) -> type:
         ordinal order.
     """
     new_space = __copy(EmptySpace)
-    new_space.__name__ = "x".join([f"{cls.__name__}" for cls in operands])
+    new_space.__name__ = "x".join(cls.__name__ for cls in operands)
 
-    new_annotation = {
-        f"{cls.__name__.lower()}_{i}": deepcopy(cls) for i, cls in enumerate(operands)
-    }
+    new_annotation = {intern(f"{cls.__name__.lower()}_{i}"): cls for i, cls in enumerate(operands)}
 
     setattr(new_space, "__annotations__", new_annotation)
 
@@ -141,7 +126,7 @@ def __dimensions(cls: type, as_types: bool = False) -> Dict[str, Union[type, str
     Dict[str, type]
         Keys are names of dimensions and values are types.
     """
-    hints = get_type_hints(cls)
+    hints = dict(__hints(cls))
 
     # If there are class type hints, then set `hints` to be the an map
     # key is the name and value is the type.
@@ -152,6 +137,32 @@ def __dimensions(cls: type, as_types: bool = False) -> Dict[str, Union[type, str
     return hints
 
 
+def __hints(cls: type) -> Tuple[Tuple[str, type], ...]:
+    """
+    Resolve the type hints of a Space type once and cache them for later calls.
+
+    Space types must not have their annotations changed after their hints are first read, so
+    the algebra operations only edit annotations of freshly copied spaces.
+
+    Parameters
+    ----------
+    cls : type
+        Space type to resolve the type hints from.
+
+    Returns
+    -------
+    Tuple[Tuple[str, type], ...]
+        Pairs of dimension names and types.
+    """
+    hints = _HINTS_CACHE.get(cls)
+
+    if hints is None:
+        hints = tuple(get_type_hints(cls).items())
+        _HINTS_CACHE[cls] = hints
+
+    return hints
+
+
 def __unroll_schema(cls: type) -> Dict[str, Union[dict, str]]:
     """
     Extract a Dictionary schema of the Space dimensions. It is recursive if there are dimensions
@@ -167,14 +178,10 @@ def __unroll_schema(cls: type) -> Dict[str, Union[dict, str]]:
     Dict[str, Union[dict, type]]
         A dict schema of the dimensions. Nested if there are inner Spaces.
     """
-    dims = __dimensions(cls, as_types=True)
-    dims_str = __dimensions(cls)
-
-    for key, value in dims.items():
-        if isinstance(value, Space):
-            dims_str[key] = __unroll_schema(value)  # type: ignore
-
-    return dims_str  # type: ignore
+    return {
+        dim_name: __unroll_schema(dim_type) if isinstance(dim_type, Space) else dim_type.__name__
+        for dim_name, dim_type in __hints(cls)
+    }
 
 
 def __rename_dims(cls: type, rename_dict: Dict[str, str]) -> type:
@@ -192,7 +199,7 @@ def __rename_dims(cls: type, rename_dict: Dict[str, str]) -> type:
         Space with renamed dimensions.
     """
     new_space = __copy(cls)
-    schema = __dimensions(new_space, as_types=True)
+    schema = __dimensions(cls, as_types=True)
 
     for old_key, new_key in rename_dict.items():
         if new_key in schema:
@@ -204,8 +211,6 @@ def __rename_dims(cls: type, rename_dict: Dict[str, str]) -> type:
             log.error("Impossible to rename. Dimension %s not found.", old_key)
             raise err
 
-    new_space.__annotations__.clear()
-
     setattr(new_space, "__annotations__", schema)
 
     return new_space
@@ -213,7 +218,11 @@ def __rename_dims(cls: type, rename_dict: Dict[str, str]) -> type:
 
 def __copy(cls: type) -> type:
     """
-    Perform an deepcopy over an given space.
+    Perform an copy over an given space.
+
+    Only the annotations are copied, as the rest of the Space state is immutable. The copy does
+    not inherit from `cls`, since type hints are merged across the MRO and the dimensions of
+    `cls` would leak into the copy.
 
     Parameters
     ----------
@@ -225,7 +234,8 @@ def __copy(cls: type) -> type:
     type
         New space instance.
     """
-    cls_dict = deepcopy(dict(cls.__dict__))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__annotations__"] = dict(cls.__annotations__)
     new_space = type(cls.__name__, (object,), cls_dict)
     return space(new_space)
 
@@ -275,17 +285,16 @@ def __cartesian(cls: type, other: type) -> type:
         return other
 
     new_space = __copy(cls)
-    new_space.__annotations__.clear()
 
     if cls.__name__ == other.__name__:
         new_space.__annotations__ = {
-            f"{cls.__name__.lower()}_0": deepcopy(cls),
-            f"{other.__name__.lower()}_1": other,
+            intern(f"{cls.__name__.lower()}_0"): cls,
+            intern(f"{other.__name__.lower()}_1"): other,
         }
     else:
         new_space.__annotations__ = {
-            cls.__name__.lower(): deepcopy(cls),
-            other.__name__.lower(): other,
+            intern(cls.__name__.lower()): cls,
+            intern(other.__name__.lower()): other,
         }
 
     new_space.__name__ = f"{cls.__name__}*{other.__name__}"
@@ -326,7 +335,8 @@ def __power(cls: type, dimension_n: int) -> type:
         return cls
 
     if isinstance(dimension_n, int) and dimension_n > 1:
-        new_annotation = {f"{cls.__name__.lower()}_{i}": deepcopy(cls) for i in range(dimension_n)}
+        dim_name = cls.__name__.lower()
+        new_annotation = {intern(f"{dim_name}_{i}"): cls for i in range(dimension_n)}
         new_space = type(f"{dimension_n}-{cls.__name__}", (object,), dict(cls.__dict__))
         setattr(new_space, "__annotations__", new_annotation)
 
@@ -363,19 +373,23 @@ def __add(cls: type, other: type) -> type:
     elif __is_empty(cls):
         return other
 
-    other_dims = __dimensions(other, as_types=True)
-
-    new_space = __copy(cls)
-    new_space.__name__ = f"{cls.__name__}+{other.__name__}"
-
-    for dim_name, dim_type in other_dims.items():
-        if dim_name in new_space.__annotations__:
-            for new_key in __generate_key(dim_name):
-                if new_key not in new_space.__annotations__:
-                    new_space.__annotations__[new_key] = dim_type
-                    break
+    # The merged annotations are built once and the Space is decorated once, instead of copying
+    # `cls` and decorating the result again after the merge.
+    annotations = dict(cls.__annotations__)
+
+    for dim_name, dim_type in __hints(other):
+        if dim_name in annotations:
+            # Colliding dimensions get the first free ordinal suffix, e.g. `dim_1`.
+            num = 1
+            while f"{dim_name}_{num}" in annotations:
+                num += 1
+            annotations[intern(f"{dim_name}_{num}")] = dim_type
         else:
-            new_space.__annotations__[dim_name] = dim_type
+            annotations[dim_name] = dim_type
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__annotations__"] = annotations
+    new_space = type(f"{cls.__name__}+{other.__name__}", (object,), cls_dict)
 
     return space(new_space)
 
@@ -404,8 +418,7 @@ def __nest(cls: type, name_change: bool = True) -> type:
     if name_change:
         new_space.__name__ = f"nested-{cls.__name__}"
 
-    new_space.__annotations__.clear()
-    new_space.__annotations__[cls.__name__] = deepcopy(cls)
+    new_space.__annotations__ = {cls.__name__: cls}
 
     return space(new_space)
 
@@ -424,48 +437,77 @@ def __is_empty(cls: type) -> bool:
     bool
         True if there are no defined dimensionse, False otherwise.
     """
-    return not bool(__dimensions(cls, as_types=True))
+    return not __hints(cls)
 
 
 def __init__(self: Any, *args: Any, **kwargs: Any) -> None:  # noqa: N807
     raise InstanceError
 
 
-def __generate_key(existing_key: str) -> Generator[str, None, None]:
+def __is_equivalent(cls: type, other: type) -> bool:
     """
-    Ordinal number generator for a dimension.
+    Check if two Space types are equivalent in terms of their dimension types.
 
     Parameters
     ----------
-    existing_key : str
-        Dimension name.
-
-    Yields
-    ------
-    Generator for the dimension name.
+    cls : type
+    other : type
 
+    Returns
+    -------
+    bool
+        True if the Space Dimensions are all equal, False otherwise.
     """
-    num = 1
-    while True:
-        yield f"{existing_key}_{num}"
-        num += 1
+    if cls is other:
+        return True
 
+    cls_hash, cls_types = __dim_types(cls)
+    other_hash, other_types = __dim_types(other)
+    # The hashes are cached, so most non-equivalent spaces are told apart without a comparison
+    # of their dimension types.
+    return cls_hash == other_hash and cls_types == other_types
 
-def __is_equivalent(cls: type, other: type) -> bool:
+
+def __dim_types(cls: type) -> Tuple[int, Tuple[type, ...]]:
     """
-    Check if two Space types are equivalent in terms of their dimension types.
+    Get the dimension types of a Space type along with their hash, caching both for later calls.
 
     Parameters
     ----------
     cls : type
-    other : type
+        Space type to retrieve the dimension types from.
 
     Returns
     -------
-    bool
-        True if the Space Dimensions are all equal, False otherwise.
-    """
-    return list(__dimensions(cls, True).values()) == list(__dimensions(other, True).values())
+    Tuple[int, Tuple[type, ...]]
+        Hash of the dimension types and the dimension types, in order.
+    """
+    dim_types = _DIM_TYPES_CACHE.get(cls)
+
+    if dim_types is None:
+        types = tuple(dim_type for _, dim_type in __hints(cls))
+        dim_types = (hash(types), types)
+        _DIM_TYPES_CACHE[cls] = dim_types
+
+    return dim_types
+
+
+# Methods bound to every Space type. The classmethod wrappers are shared, as they only bind to
+# the class they are accessed from.
+_SPACE_METHODS: Dict[str, Any] = {
+    "dimensions": classmethod(__dimensions),
+    "cartesian": classmethod(__cartesian),
+    "pow": classmethod(__power),
+    "name": classmethod(__name),
+    "copy": classmethod(__copy),
+    "rename_dims": classmethod(__rename_dims),
+    "is_empty": classmethod(__is_empty),
+    "unroll_schema": classmethod(__unroll_schema),
+    "add": classmethod(__add),
+    "nest": classmethod(__nest),
+    "is_equivalent": classmethod(__is_equivalent),
+    __init__.__name__: __init__,
+}
 
 
 @space
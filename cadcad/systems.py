@@ -1,7 +1,7 @@
 """Systems, Simulations and Experiments definitions."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 from cadcad.dynamics import Block
 from cadcad.errors import BlockInputError, BlockOutputError, WiringError
@@ -11,6 +11,8 @@ from cadcad.points import Point
 class Trajectory:
     """Collection of Points resulting from a simulation"""
 
+    __slots__ = ("__data",)
+
     def __init__(self) -> None:
         self.__data: List[Point] = []
 
@@ -36,14 +38,9 @@ class Trajectory:
         return self.__data
 
     def __str__(self) -> str:
-        """Return a string representation of a space."""
-        newline = "\n"
-
-        str_result = f"Trajectory has points:{newline}"
-        for point in self.data:
-            str_result += f"{str(point)}{newline}"
-
-        return str_result
+        """Return a string representation of a trajectory."""
+        points = "".join(f"{point}\n" for point in self.data)
+        return f"Trajectory has points:\n{points}"
 
 
 @dataclass
@@ -58,18 +55,21 @@ class Experiment:
         self._validate_pipeline()
 
     def _validate_pipeline(self):
-        for i in range(len(self.pipeline) - 1):
-            curr_block = self.pipeline[i]
-            next_block = self.pipeline[i + 1]
-            if curr_block.codomain_names != next_block.domain_names:
+        for curr_block, next_block in zip(self.pipeline, self.pipeline[1:]):
+            if self._as_names(curr_block.codomain_names) != self._as_names(next_block.domain_names):
                 raise WiringError(curr_block, next_block)
 
     @staticmethod
-    def _execute_and_validate_block(current_state, block):
-        if current_state.space.name() != block.domain_names:
+    def _as_names(names: Union[str, List[str]]) -> List[str]:
+        """Return space names as a list, wrapping the name of a single Point."""
+        return [names] if isinstance(names, str) else list(names)
+
+    @staticmethod
+    def _execute_and_validate_block(current_state, block, function, domain_name, codomain_names):
+        if current_state.space.name() != domain_name:
             raise BlockInputError(current_state, block)
-        next_state = block(current_state)
-        if next_state.space.name() != block.codomain_names:
+        next_state = function(current_state)
+        if next_state.space.name() != codomain_names:
             raise BlockOutputError(block, next_state)
         return next_state
 
@@ -83,13 +83,24 @@ class Experiment:
         """
         result_matrix: List[Trajectory] = []
 
+        # Resolve every block's function and space names once instead of once per block per
+        # step. Calling the raw function also skips the `Block.__call__` frame on each step.
+        stages = []
+        for block in self.pipeline:
+            domain_names = self._as_names(block.domain_names)
+            # The state is a single Point, so only blocks with a single domain can accept it.
+            domain_name = domain_names[0] if len(domain_names) == 1 else None
+            stages.append((block, block.function, domain_name, block.codomain_names))
+        execute_and_validate = self._execute_and_validate_block
+
         for _ in range(self.experiment_params["iteration_n"]):
             current_state = self.init_state
             result = Trajectory()
             for _ in range(self.experiment_params["steps"]):
-                for block in self.pipeline:
-                    next_state = self._execute_and_validate_block(current_state, block)
-                    current_state = next_state
+                for block, function, domain_name, codomain_names in stages:
+                    current_state = execute_and_validate(
+                        current_state, block, function, domain_name, codomain_names
+                    )
                 result.append(current_state)
 
             result_matrix.append(result)
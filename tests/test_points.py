@@ -0,0 +1,98 @@
+"""Testing the points.
+
+This should run as part of the CI/CD pipeline.
+"""
+from copy import deepcopy
+
+from pytest import fixture, raises
+
+from cadcad.points import Point, check_schema
+from cadcad.spaces import space
+
+# pylint: disable=line-too-long, missing-function-docstring, missing-class-docstring, invalid-name, redefined-outer-name  # noqa: E501
+
+
+@fixture
+def space1() -> type:
+    @space
+    class Space1:
+        d_1: int
+        d_2: int
+
+    return Space1
+
+
+@fixture
+def nested_space(space1) -> type:
+    @space
+    class NestedSpace:
+        inner: space1
+        d_3: float
+
+    return NestedSpace
+
+
+def test_point_schema_mismatch(space1) -> None:
+    with raises(ValueError):
+        Point(space1, {"d_1": 1, "d_2": "2"})
+
+
+def test_point_data_is_read_only(space1) -> None:
+    data = {"d_1": 1, "d_2": 2}
+    point = Point(space1, data)
+    data["d_1"] = 3
+
+    assert point["d_1"] == 1
+    with raises(TypeError):
+        point.data["d_1"] = 3  # type: ignore
+
+
+def test_point_from_point_data(space1) -> None:
+    point = Point(space1, {"d_1": 1, "d_2": 2})
+    assert Point(space1, point.data) == point
+
+
+def test_point_deepcopy(space1) -> None:
+    point = Point(space1, {"d_1": 1, "d_2": 2})
+    point_copy = deepcopy(point)
+
+    assert point_copy == point and point_copy is not point
+    assert point_copy.space is point.space
+    with raises(TypeError):
+        point_copy.data["d_1"] = 3  # type: ignore
+
+
+def test_point_equality_and_hash(space1) -> None:
+    point = Point(space1, {"d_1": 1, "d_2": 2})
+    same_point = Point(space1, {"d_2": 2, "d_1": 1})
+    other_point = Point(space1, {"d_1": 1, "d_2": 3})
+
+    assert point == same_point
+    assert hash(point) == hash(same_point)
+    assert point != other_point
+    assert len({point, same_point, other_point}) == 2
+
+
+def test_nested_point(nested_space) -> None:
+    data = {"inner": {"d_1": 1, "d_2": 2}, "d_3": 3.0}
+    assert Point(nested_space, data)["inner"] == {"d_1": 1, "d_2": 2}
+    assert Point(nested_space, dict(data))["d_3"] == 3.0
+    assert check_schema(nested_space.dimensions(as_types=True), data)
+
+
+def test_nested_point_schema_mismatch(nested_space) -> None:
+    with raises(ValueError):
+        Point(nested_space, {"inner": {"d_1": 1, "d_2": "2"}, "d_3": 3.0})
+    with raises(ValueError):
+        Point(nested_space, {"inner": {"d_1": 1}, "d_3": 3.0})
+    with raises(ValueError):
+        Point(nested_space, {"inner": 1, "d_3": 3.0})
+    assert not check_schema(nested_space.dimensions(as_types=True), {"inner": 1, "d_3": 3.0})
+
+
+def test_nested_point_deepcopy(nested_space) -> None:
+    point = Point(nested_space, {"inner": {"d_1": 1, "d_2": 2}, "d_3": 3.0})
+    point_copy = deepcopy(point)
+
+    assert point_copy == point
+    assert point_copy["inner"] is not point["inner"]
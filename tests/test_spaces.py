@@ -69,6 +69,8 @@ def test_repeated_merge_product(space1: Space) -> None:
 def test_copy(space1: Space) -> None:
     Space_1_Copy = space1.copy()  # noqa: N806
     assert Space_1_Copy.is_equivalent(space1) and (Space_1_Copy != space1)
+    assert Space_1_Copy.dimensions() == space1.dimensions()
+    assert Space_1_Copy.__annotations__ is not space1.__annotations__
 
 
 def test_is_empty(space1: Space, emptyspace: Space) -> None:
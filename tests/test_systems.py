@@ -1,8 +1,13 @@
+from copy import copy, deepcopy
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from cadcad.dynamics import Block, block
+from cadcad.errors import BlockInputError, BlockOutputError, WiringError
 from cadcad.points import Point
 from cadcad.spaces import Space, space
+from cadcad.systems import Experiment
 
 # pylint: disable=line-too-long, missing-function-docstring, missing-class-docstring, invalid-name, redefined-outer-name  # noqa: E501
 
@@ -73,31 +78,107 @@ def experiment_params() -> dict:
     return {"iteration_n": 1, "steps": 1}
 
 
-def test_valid_wiring(first_block: Block, second_block: Block, experiment_params: dict) -> None:
-    pass
+def test_block_explicit_signature(first_space: Space, second_space: Space) -> None:
+    def unannotated(domain):
+        return Point(second_space, {"pickles": 1.0, "skittles": 2.0})
+
+    explicit_block = block(unannotated, domain=[Point[first_space]], codomain=Point[second_space])
+    assert explicit_block.domain_names == ["FirstSpace"]
+    assert explicit_block.codomain_names == "SecondSpace"
+
+    with pytest.raises(TypeError):
+        block(unannotated, domain=[first_space], codomain=Point[second_space])
+
+    def annotated(domain: Point[first_space]) -> Point[second_space]:
+        return Point(second_space, {"pickles": 1.0, "skittles": 2.0})
+
+    assert block(annotated, codomain=Point[first_space]).codomain_names == "FirstSpace"
+
+    with pytest.raises(TypeError):
+        block(annotated, domain=[int])
+
+    with pytest.raises(TypeError):
+        block(annotated, codomain=int)
+
+    with pytest.raises(TypeError):
+        block(annotated, domain=[{}])
+
+
+def test_block_reads_current_annotations(first_space: Space, second_space: Space) -> None:
+    def annotated(domain: Point[first_space]) -> Point[second_space]:
+        return Point(second_space, {"pickles": 1.0, "skittles": 2.0})
+
+    assert block(annotated).codomain_names == "SecondSpace"
+    annotated.__annotations__["return"] = Point[first_space]
+    assert block(annotated).codomain_names == "FirstSpace"
+
+
+def test_block_str(first_block: Block) -> None:
+    block_str = str(first_block)
+    assert block_str.startswith("Block first_space_to_second_space ")
+    assert "has domains" in block_str and "has codomains" in block_str
+
+
+def test_block_is_read_only(first_block: Block, second_space: Space) -> None:
+    with pytest.raises(FrozenInstanceError):
+        first_block.domain = [Point[second_space]]  # type: ignore
+    assert isinstance(first_block.domain, tuple)
+    assert first_block.domain_names == ["FirstSpace"]
+    assert hash(first_block) == hash(copy(first_block))
+
+
+def test_block_deepcopy(first_space: Space, second_space: Space) -> None:
+    def unannotated(domain):
+        return Point(second_space, {"pickles": 1.0, "skittles": 2.0})
+
+    direct_block = Block(unannotated, [Point[first_space]], Point[second_space])
+    block_copy = deepcopy(direct_block)
+
+    assert block_copy == direct_block
+    assert isinstance(block_copy.domain, tuple)
+    assert block_copy.domain_names == ["FirstSpace"]
+
+
+@pytest.fixture()
+def first_point(first_space: Space) -> Point:
+    return Point(first_space, {"dim1": 1, "dim2": 2})
+
+
+def test_valid_wiring(
+    first_point: Point, first_block: Block, second_block: Block, experiment_params: dict
+) -> None:
+    experiment = Experiment(first_point, experiment_params, (first_block, second_block))
+    (trajectory,) = experiment.run()
+    assert trajectory.data[-1].data == {"candy": "yum", "popcorn": "ew"}
 
 
-def test_invalid_wiring(first_block: Block, experiment_params: dict) -> None:
-    pass
+def test_invalid_wiring(first_point: Point, first_block: Block, experiment_params: dict) -> None:
+    with pytest.raises(WiringError):
+        Experiment(first_point, experiment_params, (first_block, first_block))
 
 
-def test_valid_block_input(first_space: Space, first_block: Block, experiment_params: dict) -> None:
-    pass
+def test_valid_block_input(first_point: Point, first_block: Block, experiment_params: dict) -> None:
+    (trajectory,) = Experiment(first_point, experiment_params, (first_block,)).run()
+    assert trajectory.data[-1].space.name() == "SecondSpace"
 
 
 def test_invalid_block_input(
     second_space: Space, first_block: Block, experiment_params: dict
 ) -> None:
-    pass
+    init_state = Point(second_space, {"pickles": 1.0, "skittles": 2.0})
+    with pytest.raises(BlockInputError):
+        Experiment(init_state, experiment_params, (first_block,)).run()
 
 
 def test_valid_block_output(
-    first_space: Space, first_block: Block, experiment_params: dict
+    first_point: Point, first_block: Block, experiment_params: dict
 ) -> None:
-    pass
+    (trajectory,) = Experiment(first_point, experiment_params, (first_block,)).run()
+    assert trajectory.data[-1].data == {"pickles": 1.0, "skittles": 2.0}
 
 
 def test_invalid_block_output(
-    first_space: Space, first_block_with_invalid_output: Block, experiment_params: dict
+    first_point: Point, first_block_with_invalid_output: Block, experiment_params: dict
 ) -> None:
-    pass
+    with pytest.raises(BlockOutputError):
+        Experiment(first_point, experiment_params, (first_block_with_invalid_output,)).run()